@@ -1,12 +1,120 @@
 """
 PL/0 Lexical Analyzer Core Implementation
-Implemented using the loop-branch method
+Implemented using a precompiled master regular expression
 """
 
-from token_type import TokenType, KEYWORDS
+import re
+from array import array
+from bisect import bisect_right
+from collections import Counter
+
+from token_type import TokenType, KEYWORDS, TOKEN_NAMES
 from token import Token
 
 
+# Master pattern: leading whitespace and comments followed by one named
+# alternative per lexical category. Whitespace and closed comments are
+# consumed by the regex engine as part of the next match, so they never
+# reach the Python loop; what is left at the end of the source is consumed
+# by a final match of the \Z alternative, which has no name.
+# Alternatives are tried in order, so unclosed comments come before '(' and
+# the two-character operators come before their single-character prefixes.
+# A number running into letters is matched whole as BADNUM before INT.
+# An unclosed comment runs to the end of the source and is reported by the
+# tokenizer. Character classes are ASCII-only (re.ASCII), so the regex
+# engine never consults the Unicode property tables.
+_MASTER = re.compile(
+    r"(?:\s+|\{[^}]*\}|\(\*.*?\*\))*(?:"
+    r"(?P<IDENT>[A-Za-z][A-Za-z0-9]*)"
+    r"|(?P<BADNUM>[0-9]+[A-Za-z][A-Za-z0-9]*)"
+    r"|(?P<INT>[0-9]+)"
+    r"|(?P<BCMT>\{.*)"
+    r"|(?P<PCMT>\(\*.*)"
+    r"|(?P<ASSIGN>:=)"
+    r"|(?P<LEQ><=)"
+    r"|(?P<NEQ><>)"
+    r"|(?P<LT><)"
+    r"|(?P<GEQ>>=)"
+    r"|(?P<GT>>)"
+    r"|(?P<PLUS>\+)"
+    r"|(?P<MINUS>-)"
+    r"|(?P<TIMES>\*)"
+    r"|(?P<DIVIDE>/)"
+    r"|(?P<EQ>=)"
+    r"|(?P<LPAREN>\()"
+    r"|(?P<RPAREN>\))"
+    r"|(?P<SEMICOLON>;)"
+    r"|(?P<COMMA>,)"
+    r"|(?P<COLON>:)"
+    r"|(?P<BAD>\S)"
+    r"|\Z)",
+    re.ASCII | re.DOTALL
+)
+
+# Dispatch table indexed by the number of the group that matched: the INT,
+# operator and delimiter alternatives are named after their token types, so
+# their token type is found with one list index instead of a chain of tests
+_GROUP_TOKENS = [None] * (_MASTER.groups + 1)
+for _name, _index in _MASTER.groupindex.items():
+    if _name in TokenType.__members__:
+        _GROUP_TOKENS[_index] = TokenType[_name]
+del _name, _index
+
+# Group number of the identifier alternative, which needs a keyword lookup
+_IDENT_GROUP = _MASTER.groupindex['IDENT']
+
+# Reserve table grouped by keyword length: identifiers whose length matches
+# no keyword are classified without lowercasing or hashing them
+_KEYWORDS_BY_LENGTH = {}
+for _word, _token_type in KEYWORDS.items():
+    _KEYWORDS_BY_LENGTH.setdefault(len(_word), {})[_word] = _token_type
+del _word, _token_type
+
+# One line of the token table written by output_to_file()
+_TOKEN_LINE_FORMAT = "{:<6} {:<6} {:<6} {:<15} {:<20}\n"
+
+# Number of token rows output_to_file() formats before each write() call
+_WRITE_BATCH = 4096
+
+# Token types by integer code, for turning stored codes back into members
+_TOKEN_TYPES = [None] * (len(TokenType) + 1)
+for _token_type in TokenType:
+    _TOKEN_TYPES[_token_type] = _token_type
+del _token_type
+
+# Lexeme of each operator and delimiter type, indexed by type code. Token
+# values of these types are taken from here instead of slicing the source,
+# so every '+' or ':=' token shares one string object.
+_FIXED_LEXEMES = [None] * (len(TokenType) + 1)
+for _token_type, _lexeme in (
+        (TokenType.PLUS, '+'), (TokenType.MINUS, '-'),
+        (TokenType.TIMES, '*'), (TokenType.DIVIDE, '/'),
+        (TokenType.EQ, '='), (TokenType.NEQ, '<>'),
+        (TokenType.LT, '<'), (TokenType.LEQ, '<='),
+        (TokenType.GT, '>'), (TokenType.GEQ, '>='),
+        (TokenType.LPAREN, '('), (TokenType.RPAREN, ')'),
+        (TokenType.SEMICOLON, ';'), (TokenType.COMMA, ','),
+        (TokenType.ASSIGN, ':=')):
+    _FIXED_LEXEMES[_token_type] = _lexeme
+del _token_type, _lexeme
+
+# Statistics category of each token type, indexed by type code
+# (EOF and ERROR tokens belong to no category)
+_CATEGORY = [None] * (len(TokenType) + 1)
+for _token_type in KEYWORDS.values():
+    _CATEGORY[_token_type] = 'keywords'
+_CATEGORY[TokenType.ID] = 'identifiers'
+_CATEGORY[TokenType.INT] = 'integers'
+for _token_type in (TokenType.PLUS, TokenType.MINUS, TokenType.TIMES, TokenType.DIVIDE,
+                    TokenType.EQ, TokenType.NEQ, TokenType.LT, TokenType.LEQ,
+                    TokenType.GT, TokenType.GEQ, TokenType.ASSIGN):
+    _CATEGORY[_token_type] = 'operators'
+for _token_type in (TokenType.LPAREN, TokenType.RPAREN,
+                    TokenType.SEMICOLON, TokenType.COMMA):
+    _CATEGORY[_token_type] = 'delimiters'
+del _token_type
+
+
 class PL0Lexer:
     """
     PL/0 Lexical Analyzer
@@ -18,73 +126,33 @@ class PL0Lexer:
     4. Outputs token sequence to a file
     """
     
-    def __init__(self, source_code):
+    def __init__(self, source_code, lazy_int=False):
         """
         Initialize the lexical analyzer
         
         :param source_code: PL/0 source program string
+        :param lazy_int: Keep integer constants as digit strings instead of
+                         converting them; callers convert with int() when
+                         they need the value (e.g. when evaluating a CONST)
         """
         self.source = source_code       # Source code
-        self.pos = 0                    # Current position pointer
-        self.line = 1                   # Current line number
-        self.column = 0                 # Current column number
-        self.current_char = None        # Current character
-        self.tokens = []                # Token list
+        self.lazy_int = lazy_int        # Defer int() conversion of INT values
+        self.tokens = []                # Token list (built by tokenize())
         self.errors = []                # Error list
         
-        # Read the first character
-        self.get_char()
-    
-    # GetChar()
-    
-    def get_char(self):
-        """
-        GetChar() - Read the next character
-        
-        Functions:
-        1. Reads the next character
-        2. Updates the position pointer
-        3. Updates line and column numbers
-        """
-        if self.pos < len(self.source):
-            self.current_char = self.source[self.pos]
-            self.pos += 1
-            self.column += 1
-            
-            # If newline is encountered, increment line number and reset column
-            if self.current_char == '\n':
-                self.line += 1
-                self.column = 0
-        else:
-            self.current_char = None  # End of file
-        
-        return self.current_char
-    
-    def peek(self, offset=1):
-        """
-        Look ahead at a character without moving the position pointer
-        
-        :param offset: Look-ahead offset
-        :return: The character seen, or None if out of range
-        """
-        peek_pos = self.pos + offset - 1
-        if peek_pos < len(self.source):
-            return self.source[peek_pos]
-        return None
-    
-    # Helper judgment methods
-    
-    def is_letter(self, char):
-        """Check if the character is a letter"""
-        return char is not None and char.isalpha()
-    
-    def is_digit(self, char):
-        """Check if the character is a digit"""
-        return char is not None and char.isdigit()
-    
-    def is_whitespace(self, char):
-        """Check if the character is a whitespace (space, tab, newline, etc.)"""
-        return char is not None and char.isspace()
+        # Scanned tokens as parallel arrays (structure of arrays): token i
+        # has type code tok_type[i] and lexeme source[tok_start[i]:tok_end[i]]
+        # on line tok_line[i]. Token objects are only built on demand.
+        self.tok_type = array('B')
+        self.tok_start = array('i')
+        self.tok_end = array('i')
+        self.tok_line = array('i')
+        
+        # Line index: _line_bases[i] is the offset just before the first
+        # column of line i + 1, i.e. -1 followed by the offset of every
+        # newline. bisect_right() on it gives the line number directly.
+        self._line_bases = [-1]
+        self._line_bases.extend(m.start() for m in re.finditer('\n', source_code))
     
     # Error handling
     
@@ -99,235 +167,157 @@ class PL0Lexer:
         error_msg = f"Lexical error (line {line}, column {column}): {message}"
         self.errors.append(error_msg)
     
-    # Skip whitespace and comments
+    # Scan the source code into token arrays
     
-    def skip_whitespace(self):
-        """Skip whitespace characters (space, tab, newline, etc.)"""
-        while self.is_whitespace(self.current_char):
-            self.get_char()
-    
-    def skip_comment(self):
+    def scan(self):
         """
-        Skip comments
-        Supports two comment formats:
-        1. {comment content}
-        2. (*comment content*)
+        Scan the entire source code into the token arrays
+        
+        The master pattern is matched repeatedly over the source and each
+        match is dispatched on the number of the group that matched
+        (whitespace and comments before it are already consumed):
+           - INT, operators and delimiters: token type from _GROUP_TOKENS
+           - IDENT: keyword or identifier (reserve table lookup)
+           - BCMT, PCMT: unclosed comment (error)
+           - BADNUM: number directly followed by letters (error)
+           - COLON: standalone ':' (error)
+           - BAD: illegal character (error)
+        
+        Only integers are stored per token (see tok_type, tok_start,
+        tok_end, tok_line); lexical errors are recorded as they are found.
+        The EOF token is stored last, positioned on the last character.
+        
+        :return: Number of tokens, including EOF
         """
-        # Handle {comment}
-        if self.current_char == '{':
-            start_line = self.line
-            start_column = self.column
-            self.get_char()  # Skip {
-            
-            while self.current_char and self.current_char != '}':
-                self.get_char()
+        self.errors = []
+        self.tokens = []
+        self.tok_type = tok_type = array('B')
+        self.tok_start = tok_start = array('i')
+        self.tok_end = tok_end = array('i')
+        self.tok_line = tok_line = array('i')
+        
+        # Bind everything used per token as locals to avoid repeated
+        # attribute and global lookups inside the loop
+        append_type = tok_type.append
+        append_start = tok_start.append
+        append_end = tok_end.append
+        append_line = tok_line.append
+        add_error = self.add_error
+        line_bases = self._line_bases
+        group_tokens = _GROUP_TOKENS
+        ident_group = _IDENT_GROUP
+        keywords_by_length = _KEYWORDS_BY_LENGTH
+        token_id = TokenType.ID
+        token_error = TokenType.ERROR
+        
+        for match in _MASTER.finditer(self.source):
+            index = match.lastindex
+            if index is None:
+                break  # Only whitespace and comments remain
             
-            if self.current_char == '}':
-                self.get_char()  # Skip }
-            else:
-                self.add_error("Unclosed comment, missing '}'", start_line, start_column)
-        
-        # Handle (*comment*)
-        elif self.current_char == '(' and self.peek() == '*':
-            start_line = self.line
-            start_column = self.column
-            self.get_char()  # Skip (
-            self.get_char()  # Skip *
+            start, end = match.span(index)
+            line = bisect_right(line_bases, start)
             
-            while self.current_char:
-                if self.current_char == '*' and self.peek() == ')':
-                    self.get_char()  # Skip *
-                    self.get_char()  # Skip )
-                    break
-                self.get_char()
-            else:
-                self.add_error("Unclosed comment, missing '*)'", start_line, start_column)
-    
-    # Identify identifiers or keywords (corresponding to Figure 3.4(a))
-    
-    def scan_identifier(self, start_line, start_column):
-        """
-        Identify identifiers or keywords
-        
-        State transition diagram:
-        State 1 (start) --letter--> State 2 (accept)
-        State 2 --letter|digit--> State 2 (loop)
-        State 2 --other--> End
-        
-        :param start_line: Starting line number
-        :param start_column: Starting column number
-        :return: Token object
-        """
-        token_str = ''
-        
-        # Read sequence of letters and digits
-        while self.is_letter(self.current_char) or self.is_digit(self.current_char):
-            token_str += self.current_char
-            self.get_char()
-        
-        # Reserve table lookup: Check if it is a keyword
-        token_str_lower = token_str.lower()
-        if token_str_lower in KEYWORDS:
-            # It is a keyword, return keyword Token
-            token_type = KEYWORDS[token_str_lower]
-            return Token(token_type, token_str, start_line, start_column)
-        else:
-            # It is an identifier, return ID Token
-            # Corresponds to InsertId(strToken) on page 45 of the textbook
-            return Token(TokenType.ID, token_str, start_line, start_column)
-    
-    # Identify integers (corresponding to Figure 3.4(a))
-    
-    def scan_number(self, start_line, start_column):
-        """
-        Identify integer constants
-        
-        State transition diagram:
-        State 1 (start) --digit--> State 2 (accept)
-        State 2 --digit--> State 2 (loop)
-        State 2 --other--> End
-        
-        :param start_line: Starting line number
-        :param start_column: Starting column number
-        :return: Token object or error Token
-        """
-        num_str = ''
-        
-        # Read sequence of digits
-        while self.is_digit(self.current_char):
-            num_str += self.current_char
-            self.get_char()
-        
-        # Error check: A letter cannot follow a number directly
-        if self.is_letter(self.current_char):
-            error_str = num_str
-            # Read all subsequent alphanumeric characters
-            while self.is_letter(self.current_char) or self.is_digit(self.current_char):
-                error_str += self.current_char
-                self.get_char()
+            # INT (InsertConst(strToken)), operators and delimiters have a
+            # fixed token type; the rest are identifiers and errors
+            token_type = group_tokens[index]
+            if token_type is None:
+                if index == ident_group:
+                    # Reserve table lookup: Check if it is a keyword
+                    # Otherwise corresponds to InsertId(strToken) on page 45 of the textbook
+                    candidates = keywords_by_length.get(end - start)
+                    if candidates is None:
+                        token_type = token_id
+                    else:
+                        token_type = candidates.get(match[index].lower(), token_id)
+                else:
+                    kind = match.lastgroup
+                    text = match[index]
+                    column = start - line_bases[line - 1]
+                    if kind == 'BCMT':
+                        add_error("Unclosed comment, missing '}'", line, column)
+                        continue
+                    elif kind == 'PCMT':
+                        add_error("Unclosed comment, missing '*)'", line, column)
+                        continue
+                    elif kind == 'BADNUM':
+                        # Error: A letter cannot follow a number directly
+                        add_error(f"Letter cannot directly follow a number: {text}", line, column)
+                    elif kind == 'COLON':
+                        # Error: Standalone : is invalid
+                        add_error("Illegal character ':', expected ':='", line, column)
+                    else:
+                        # Unrecognized character
+                        add_error(f"Illegal character: '{text}'", line, column)
+                    token_type = token_error
             
-            self.add_error(f"Letter cannot directly follow a number: {error_str}", start_line, start_column)
-            return Token(TokenType.ERROR, error_str, start_line, start_column)
-        
-        # Normal case: Convert to integer and return
-        # InsertConst(strToken)
-        int_value = int(num_str)
-        return Token(TokenType.INT, int_value, start_line, start_column)
+            append_type(token_type)
+            append_start(start)
+            append_end(end)
+            append_line(line)
+        
+        # End of file, positioned on the last character of the source
+        eof = len(self.source) - 1
+        append_type(TokenType.EOF)
+        append_start(eof)
+        append_end(eof)
+        append_line(bisect_right(line_bases, eof))
+        return len(tok_type)
     
-    # Identify operators and delimiters
+    # Build Token objects from the token arrays
     
-    def scan_operator(self, start_line, start_column):
+    def token(self, i):
         """
-        Identify operators and delimiters
+        Build the Token object for the i-th scanned token
         
-        Handles:
-        1. Single-character operators: + - * / = ( ) ; ,
-        2. Two-character operators: := <> <= >=
-        
-        :param start_line: Starting line number
-        :param start_column: Starting column number
+        :param i: Token index
         :return: Token object
         """
-        char = self.current_char
-        
-        # Handle := (assignment operator)
-        if char == ':':
-            self.get_char()
-            if self.current_char == '=':
-                self.get_char()
-                return Token(TokenType.ASSIGN, ':=', start_line, start_column)
-            else:
-                # Error: Standalone : is invalid
-                self.add_error(f"Illegal character ':', expected ':='", start_line, start_column)
-                return Token(TokenType.ERROR, ':', start_line, start_column)
-        
-        # Handle < <= <>
-        elif char == '<':
-            self.get_char()
-            if self.current_char == '=':
-                self.get_char()
-                return Token(TokenType.LEQ, '<=', start_line, start_column)
-            elif self.current_char == '>':
-                self.get_char()
-                return Token(TokenType.NEQ, '<>', start_line, start_column)
-            else:
-                return Token(TokenType.LT, '<', start_line, start_column)
-        
-        # Handle > >=
-        elif char == '>':
-            self.get_char()
-            if self.current_char == '=':
-                self.get_char()
-                return Token(TokenType.GEQ, '>=', start_line, start_column)
-            else:
-                return Token(TokenType.GT, '>', start_line, start_column)
-        
-        # Handle single-character operators and delimiters
-        single_char_tokens = {
-            '+': TokenType.PLUS,
-            '-': TokenType.MINUS,
-            '*': TokenType.TIMES,
-            '/': TokenType.DIVIDE,
-            '=': TokenType.EQ,
-            '(': TokenType.LPAREN,
-            ')': TokenType.RPAREN,
-            ';': TokenType.SEMICOLON,
-            ',': TokenType.COMMA
-        }
-        
-        if char in single_char_tokens:
-            self.get_char()
-            return Token(single_char_tokens[char], char, start_line, start_column)
-        
-        # Unrecognized character
-        self.add_error(f"Illegal character: '{char}'", start_line, start_column)
-        self.get_char()
-        return Token(TokenType.ERROR, char, start_line, start_column)
+        code = self.tok_type[i]
+        token_type = _TOKEN_TYPES[code]
+        start = self.tok_start[i]
+        line = self.tok_line[i]
+        
+        value = _FIXED_LEXEMES[code]
+        if value is None:
+            # EOF keeps None as its value
+            if token_type == TokenType.INT and not self.lazy_int:
+                value = int(self.source[start:self.tok_end[i]])
+            elif token_type != TokenType.EOF:
+                value = self.source[start:self.tok_end[i]]
+        return Token(token_type, value, line, start - self._line_bases[line - 1])
     
-    # Get the next token (main loop)
-    
-    def get_next_token(self):
+    def tokens_iter(self):
         """
-        Get the next token
-        
-        1. GetChar()
-        2. Skip whitespace and comments
-        3. Process based on character type:
-           - Letter: scan_identifier()
-           - Digit: scan_number()
-           - Other: scan_operator()
-        4. Return Token
+        Yield the scanned tokens one at a time, scanning first if needed
+        Token objects are built as they are yielded and are not stored
         
-        :return: Token object
+        :return: Generator of Token objects, ending with the EOF token
         """
-        while self.current_char:
-            # Skip whitespace characters
-            if self.is_whitespace(self.current_char):
-                self.skip_whitespace()
-                continue
-            
-            # Skip comments
-            if self.current_char == '{' or (self.current_char == '(' and self.peek() == '*'):
-                self.skip_comment()
-                continue
-            
-            # Record token starting position
-            start_line = self.line
-            start_column = self.column
-            
-            # Identify identifier or keyword
-            if self.is_letter(self.current_char):
-                return self.scan_identifier(start_line, start_column)
-            
-            # Identify number
-            if self.is_digit(self.current_char):
-                return self.scan_number(start_line, start_column)
-            
-            # Identify operators and delimiters
-            return self.scan_operator(start_line, start_column)
-        
-        # End of file
-        return Token(TokenType.EOF, None, self.line, self.column)
+        if not self.tok_type:
+            self.scan()
+        
+        # Same computation as token(), inlined
+        source = self.source
+        line_bases = self._line_bases
+        token_types = _TOKEN_TYPES
+        fixed_lexemes = _FIXED_LEXEMES
+        token_int = TokenType.INT
+        token_eof = TokenType.EOF
+        to_int = int
+        lazy_int = self.lazy_int
+        
+        for code, start, end, line in zip(self.tok_type, self.tok_start,
+                                          self.tok_end, self.tok_line):
+            token_type = token_types[code]
+            value = fixed_lexemes[code]
+            if value is None:
+                # EOF keeps None as its value
+                if token_type is token_int and not lazy_int:
+                    value = to_int(source[start:end])
+                elif token_type is not token_eof:
+                    value = source[start:end]
+            yield Token(token_type, value, line, start - line_bases[line - 1])
     
     # Perform lexical analysis on the entire source code
     
@@ -338,12 +328,8 @@ class PL0Lexer:
         
         :return: Token list
         """
-        self.tokens = []
-        while True:
-            token = self.get_next_token()
-            self.tokens.append(token)
-            if token.type == TokenType.EOF:
-                break
+        self.scan()
+        self.tokens = list(self.tokens_iter())
         return self.tokens
     
     # Output to file
@@ -351,9 +337,17 @@ class PL0Lexer:
     def output_to_file(self, filename='tokens.txt'):
         """
         Output the token sequence to an intermediate file
+        If tokenize() has not been called, Token objects are built from
+        the token arrays one at a time without being stored
+        
+        Token rows are formatted into batches of _WRITE_BATCH rows, and
+        each batch is written with a single write() call, so at most one
+        batch of formatted rows is held in memory.
         
         :param filename: Output file name
         """
+        tokens = self.tokens if self.tokens else self.tokens_iter()
+        
         with open(filename, 'w', encoding='utf-8') as f:
             # Header
             f.write("=" * 80 + "\n")
@@ -361,13 +355,22 @@ class PL0Lexer:
             f.write("=" * 80 + "\n\n")
             
             # Token list
-            f.write(f"{'Index':<6} {'Line':<6} {'Column':<6} {'Type':<15} {'Value':<20}\n")
+            f.write(_TOKEN_LINE_FORMAT.format('Index', 'Line', 'Column', 'Type', 'Value'))
             f.write("-" * 80 + "\n")
             
-            for idx, token in enumerate(self.tokens, 1):
-                if token.type != TokenType.EOF:
-                    f.write(f"{idx:<6} {token.line:<6} {token.column:<6} "
-                           f"{token.type:<15} {str(token.value):<20}\n")
+            batch = []
+            append = batch.append
+            token_line = _TOKEN_LINE_FORMAT.format
+            token_eof = TokenType.EOF
+            token_names = TOKEN_NAMES
+            for idx, token in enumerate(tokens, 1):
+                if token.type is not token_eof:
+                    append(token_line(idx, token.line, token.column,
+                                      token_names[token.type], str(token.value)))
+                    if len(batch) >= _WRITE_BATCH:
+                        f.write("".join(batch))
+                        batch.clear()
+            f.write("".join(batch))
             
             f.write("\n" + "=" * 80 + "\n")
             
@@ -389,10 +392,13 @@ class PL0Lexer:
         """
         Get lexical analysis statistics
         
+        Token types are counted directly from the token type array, then
+        each type's count is added to its category via _CATEGORY
+        
         :return: Statistics dictionary
         """
         stats = {
-            'total_tokens': len(self.tokens) - 1,  # Exclude EOF
+            'total_tokens': len(self.tok_type) - 1,  # Exclude EOF
             'keywords': 0,
             'identifiers': 0,
             'integers': 0,
@@ -401,24 +407,9 @@ class PL0Lexer:
             'errors': len(self.errors)
         }
         
-        for token in self.tokens:
-            if token.type in [TokenType.PROGRAM, TokenType.CONST, TokenType.VAR, 
-                            TokenType.PROCEDURE, TokenType.BEGIN, TokenType.END,
-                            TokenType.IF, TokenType.THEN, TokenType.ELSE,
-                            TokenType.WHILE, TokenType.DO, TokenType.CALL,
-                            TokenType.READ, TokenType.WRITE, TokenType.ODD]:
-                stats['keywords'] += 1
-            elif token.type == TokenType.ID:
-                stats['identifiers'] += 1
-            elif token.type == TokenType.INT:
-                stats['integers'] += 1
-            elif token.type in [TokenType.PLUS, TokenType.MINUS, TokenType.TIMES, 
-                              TokenType.DIVIDE, TokenType.EQ, TokenType.NEQ,
-                              TokenType.LT, TokenType.LEQ, TokenType.GT, TokenType.GEQ,
-                              TokenType.ASSIGN]:
-                stats['operators'] += 1
-            elif token.type in [TokenType.LPAREN, TokenType.RPAREN, 
-                              TokenType.SEMICOLON, TokenType.COMMA]:
-                stats['delimiters'] += 1
+        for code, count in Counter(self.tok_type).items():
+            category = _CATEGORY[code]
+            if category is not None:
+                stats[category] += count
         
         return stats
\ No newline at end of file
@@ -6,7 +6,7 @@ Provides a command-line interface
 import sys
 import os
 from lexer import PL0Lexer
-from token_type import TokenType
+from token_type import TokenType, TOKEN_NAMES
 
 
 def print_header():
@@ -71,7 +71,7 @@ def print_tokens(tokens):
             if len(value_str) > 20:
                 value_str = value_str[:17] + "..."
             print(f"{idx:<6} {token.line:<6} {token.column:<6} "
-                  f"{token.type:<15} {value_str:<20}")
+                  f"{TOKEN_NAMES[token.type]:<15} {value_str:<20}")
 
 
 def print_statistics(stats):
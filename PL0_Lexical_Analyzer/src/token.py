@@ -3,6 +3,8 @@ Token Class Definition
 Represents a lexical unit (Token)
 """
 
+from token_type import TokenType
+
 
 class Token:
     """
@@ -11,12 +13,15 @@ class Token:
     return(code, value)
     
     Attributes:
-        type (str): Token type (code)
+        type (TokenType): Token type (code)
         value: Token value (value)
         line (int): Line number
         column (int): Column number
     """
     
+    # Fixed attribute layout: no per-instance __dict__
+    __slots__ = ('type', 'value', 'line', 'column')
+    
     def __init__(self, token_type, value, line, column):
         """
         Initialize a Token
@@ -36,7 +41,7 @@ class Token:
         String representation of the Token
         Format: <type, value, line, column>
         """
-        return f"<{self.type}, {self.value}, line{self.line}, column{self.column}>"
+        return f"<{self.type.name}, {self.value}, line{self.line}, column{self.column}>"
     
     def __repr__(self):
         """
@@ -50,10 +55,8 @@ class Token:
         """
         if not isinstance(other, Token):
             return False
-        return (self.type == other.type and 
-                self.value == other.value and
-                self.line == other.line and
-                self.column == other.column)
+        return ((self.type, self.value, self.line, self.column) ==
+                (other.type, other.value, other.line, other.column))
     
     def to_dict(self):
         """
@@ -63,7 +66,7 @@ class Token:
         :return: Token in dictionary format
         """
         return {
-            'type': self.type,
+            'type': self.type.name,
             'value': self.value,
             'line': self.line,
             'column': self.column
@@ -86,7 +89,7 @@ class Token:
         :return: Token object
         """
         return cls(
-            token_type=data['type'],
+            token_type=TokenType[data['type']],
             value=data['value'],
             line=data['line'],
             column=data['column']
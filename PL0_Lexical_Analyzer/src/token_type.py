@@ -3,58 +3,61 @@ Token Type Definitions
 Defines all token types and keyword table for the PL/0 language
 """
 
+from enum import IntEnum
 
-class TokenType:
+
+class TokenType(IntEnum):
     """
     Token Type Enumeration
-    Each token has a unique type identifier
+    Each token has a unique integer code, so types compare as integers
+    and can be used directly as list indices
     """
     
     # Keywords (1-15)
-    PROGRAM = 'PROGRAM'          # program
-    CONST = 'CONST'              # const
-    VAR = 'VAR'                  # var
-    PROCEDURE = 'PROCEDURE'      # procedure
-    BEGIN = 'BEGIN'              # begin
-    END = 'END'                  # end
-    IF = 'IF'                    # if
-    THEN = 'THEN'                # then
-    ELSE = 'ELSE'                # else
-    WHILE = 'WHILE'              # while
-    DO = 'DO'                    # do
-    CALL = 'CALL'                # call
-    READ = 'READ'                # read
-    WRITE = 'WRITE'              # write
-    ODD = 'ODD'                  # odd
+    PROGRAM = 1                  # program
+    CONST = 2                    # const
+    VAR = 3                      # var
+    PROCEDURE = 4                # procedure
+    BEGIN = 5                    # begin
+    END = 6                      # end
+    IF = 7                       # if
+    THEN = 8                     # then
+    ELSE = 9                     # else
+    WHILE = 10                   # while
+    DO = 11                      # do
+    CALL = 12                    # call
+    READ = 13                    # read
+    WRITE = 14                   # write
+    ODD = 15                     # odd
     
     # Identifiers and Constants (16-17)
-    ID = 'ID'                    # Identifier
-    INT = 'INT'                  # Integer constant
+    ID = 16                      # Identifier
+    INT = 17                     # Integer constant
     
     # Arithmetic Operators (18-21)
-    PLUS = 'PLUS'                # +
-    MINUS = 'MINUS'              # -
-    TIMES = 'TIMES'              # *
-    DIVIDE = 'DIVIDE'            # /
+    PLUS = 18                    # +
+    MINUS = 19                   # -
+    TIMES = 20                   # *
+    DIVIDE = 21                  # /
     
     # Relational Operators (22-27)
-    EQ = 'EQ'                    # =
-    NEQ = 'NEQ'                  # <>
-    LT = 'LT'                    # <
-    LEQ = 'LEQ'                  # <=
-    GT = 'GT'                    # >
-    GEQ = 'GEQ'                  # >=
+    EQ = 22                      # =
+    NEQ = 23                     # <>
+    LT = 24                      # <
+    LEQ = 25                     # <=
+    GT = 26                      # >
+    GEQ = 27                     # >=
     
     # Delimiters (28-32)
-    LPAREN = 'LPAREN'            # (
-    RPAREN = 'RPAREN'            # )
-    SEMICOLON = 'SEMICOLON'      # ;
-    COMMA = 'COMMA'              # ,
-    ASSIGN = 'ASSIGN'            # :=
+    LPAREN = 28                  # (
+    RPAREN = 29                  # )
+    SEMICOLON = 30               # ;
+    COMMA = 31                   # ,
+    ASSIGN = 32                  # :=
     
-    # Special Tokens
-    EOF = 'EOF'                  # End of file
-    ERROR = 'ERROR'              # Error token
+    # Special Tokens (33-34)
+    EOF = 33                     # End of file
+    ERROR = 34                   # Error token
 
 
 # Reserve Table
@@ -77,6 +80,14 @@ KEYWORDS = {
 }
 
 
+# Token Type Names indexed by type code (for output)
+# Indexing this list is cheaper than reading the Enum .name property
+TOKEN_NAMES = [None] * (len(TokenType) + 1)
+for _token_type in TokenType:
+    TOKEN_NAMES[_token_type] = _token_type.name
+del _token_type
+
+
 # Token Type Descriptions in Chinese (for output)
 TOKEN_DESCRIPTIONS = {
     # Keywords